@@ -1,3 +1,101 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
\ No newline at end of file
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import views
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class SignupViewTests(TestCase):
+    """Tests for the signup form validation"""
+
+    def signup(self, **overrides):
+        data = {
+            'username': 'newuser',
+            'email': 'newuser@example.com',
+            'password': 'Str0ng-Passw0rd',
+            'confirm_password': 'Str0ng-Passw0rd',
+        }
+        data.update(overrides)
+        return self.client.post(reverse('signup'), data)
+
+    def error_messages(self, response):
+        return [str(message) for message in response.context['messages']]
+
+    def test_rejects_username_without_letters_or_numbers(self):
+        response = self.signup(username='...')
+        self.assertIn(
+            'Username can only contain letters, numbers, and .-_ characters.',
+            self.error_messages(response),
+        )
+        self.assertFalse(User.objects.filter(username='...').exists())
+
+    def test_rejects_taken_username(self):
+        User.objects.create_user(username='newuser', email='other@example.com', password='x')
+        messages = self.error_messages(self.signup())
+        self.assertIn('Username already exists. Please choose a different one.', messages)
+        self.assertNotIn('Email already registered. Please use a different email.', messages)
+
+    def test_rejects_taken_email(self):
+        User.objects.create_user(username='otheruser', email='newuser@example.com', password='x')
+        messages = self.error_messages(self.signup())
+        self.assertIn('Email already registered. Please use a different email.', messages)
+        self.assertNotIn('Username already exists. Please choose a different one.', messages)
+
+    def test_rejects_taken_username_and_email(self):
+        User.objects.create_user(username='newuser', email='first@example.com', password='x')
+        User.objects.create_user(username='otheruser', email='newuser@example.com', password='x')
+        messages = self.error_messages(self.signup())
+        self.assertIn('Username already exists. Please choose a different one.', messages)
+        self.assertIn('Email already registered. Please use a different email.', messages)
+
+    def test_empty_email_is_left_out_of_lookup(self):
+        # Users without an email must not make a blank email look taken
+        User.objects.create_user(username='noemail', email='', password='x')
+        with self.assertNumQueries(1):
+            response = self.signup(email='')
+        messages = self.error_messages(response)
+        self.assertIn('All fields are required.', messages)
+        self.assertNotIn('Email already registered. Please use a different email.', messages)
+        self.assertNotIn('Username already exists. Please choose a different one.', messages)
+
+    def test_malformed_username_and_email_skip_lookup(self):
+        with self.assertNumQueries(0):
+            response = self.signup(username='ab', email='not-an-email')
+        self.assertEqual(self.error_messages(response), [
+            'Username must be at least 3 characters long.',
+            'Please enter a valid email address.',
+        ])
+
+    def test_rejects_common_password(self):
+        response = self.signup(password='iloveyou', confirm_password='iloveyou')
+        self.assertIn(
+            'Password is too common. Please choose a stronger password.',
+            self.error_messages(response),
+        )
+        self.assertFalse(User.objects.filter(username='newuser').exists())
+
+
+class ApiViewTests(TestCase):
+    """Tests for the JSON API endpoints"""
+
+    def setUp(self):
+        user = User.objects.create_user(username='apiuser', password='x')
+        self.client.force_login(user)
+
+    def assertJsonMatches(self, url_name, expected):
+        response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), expected)
+
+    def test_environmental_data(self):
+        self.assertJsonMatches('api_environmental', views.get_environmental_data())
+
+    def test_genomic_data(self):
+        self.assertJsonMatches('api_genomic', views.get_genomic_data())
+
+    def test_chart_data(self):
+        self.assertJsonMatches('api_charts', views.get_chart_data())
@@ -3,16 +3,28 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth.models import User
-from django.http import JsonResponse
+from django.db.models import Q
+from django.http import HttpResponse
 from django.db import IntegrityError
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
 import json
 import logging
+import re
 
 # Get logger for this module
 logger = logging.getLogger('dashboard')
 
+# Usernames may contain letters, numbers and the .-_ characters, and must
+# include at least one letter or number
+_USERNAME_RE = re.compile(r'(?=.*[^\W_])[\w.-]+')
+
+# Passwords rejected outright at signup. Shorter or all-digit passwords are
+# already rejected by earlier checks, so only list 8+ character non-numeric ones
+_COMMON_PASSWORDS = frozenset({
+    'password', 'iloveyou',
+})
+
 
 def login_view(request):
     """Handle user login with secure authentication"""
@@ -61,25 +73,44 @@ def signup_view(request):
         if not all([username, email, password, confirm_password]):
             errors.append('All fields are required.')
         
-        # Username validation
+        # Username format validation
+        username_error = None
         if username:
             if len(username) < 3:
-                errors.append('Username must be at least 3 characters long.')
+                username_error = 'Username must be at least 3 characters long.'
             elif len(username) > 150:
-                errors.append('Username must be less than 150 characters.')
-            elif not username.replace('_', '').replace('-', '').replace('.', '').isalnum():
-                errors.append('Username can only contain letters, numbers, and .-_ characters.')
-            elif User.objects.filter(username=username).exists():
-                errors.append('Username already exists. Please choose a different one.')
+                username_error = 'Username must be less than 150 characters.'
+            elif not _USERNAME_RE.fullmatch(username):
+                username_error = 'Username can only contain letters, numbers, and .-_ characters.'
         
-        # Email validation
+        # Email format validation
+        email_error = None
         if email:
             try:
                 validate_email(email)
-                if User.objects.filter(email=email).exists():
-                    errors.append('Email already registered. Please use a different email.')
             except ValidationError:
-                errors.append('Please enter a valid email address.')
+                email_error = 'Please enter a valid email address.'
+        
+        # Look up well-formed usernames and emails in a single query
+        lookup = Q()
+        if username and not username_error:
+            lookup |= Q(username=username)
+        if email and not email_error:
+            lookup |= Q(email=email)
+        if lookup:
+            username_taken = email_taken = False
+            for existing_username, existing_email in User.objects.filter(lookup).values_list('username', 'email'):
+                username_taken = username_taken or existing_username == username
+                email_taken = email_taken or existing_email == email
+            if username_taken and not username_error:
+                username_error = 'Username already exists. Please choose a different one.'
+            if email_taken and not email_error:
+                email_error = 'Email already registered. Please use a different email.'
+        
+        if username_error:
+            errors.append(username_error)
+        if email_error:
+            errors.append(email_error)
         
         # Password validation
         if password:
@@ -87,7 +118,7 @@ def signup_view(request):
                 errors.append('Password must be at least 8 characters long.')
             elif password.isdigit():
                 errors.append('Password cannot be entirely numeric.')
-            elif password.lower() in ['password', '12345678', 'qwerty', 'abc123']:
+            elif password.lower() in _COMMON_PASSWORDS:
                 errors.append('Password is too common. Please choose a stronger password.')
             elif username and password.lower() == username.lower():
                 errors.append('Password cannot be the same as your username.')
@@ -158,114 +189,130 @@ def logout_view(request):
     return redirect('login')
 
 
+# Hardcoded demo data, built once at import time and shared by every request.
+# Treat these as read-only: the API serves pre-serialized copies of them below.
+_ENVIRONMENTAL_DATA = {
+    'temperature': {
+        'value': 23.5, 
+        'unit': '°C', 
+        'status': 'normal',
+        'description': 'Water temperature within optimal range'
+    },
+    'humidity': {
+        'value': 65, 
+        'unit': '%', 
+        'status': 'normal',
+        'description': 'Atmospheric humidity levels stable'
+    },
+    'ph_level': {
+        'value': 7.2, 
+        'unit': 'pH', 
+        'status': 'optimal',
+        'description': 'pH levels ideal for aquatic life'
+    },
+    'oxygen': {
+        'value': 8.5, 
+        'unit': 'mg/L', 
+        'status': 'good',
+        'description': 'Dissolved oxygen levels healthy'
+    },
+    'turbidity': {
+        'value': 2.1, 
+        'unit': 'NTU', 
+        'status': 'clear',
+        'description': 'Water clarity excellent'
+    },
+    'conductivity': {
+        'value': 450, 
+        'unit': 'μS/cm', 
+        'status': 'normal',
+        'description': 'Electrical conductivity within range'
+    },
+}
+
+_GENOMIC_DATA = {
+    'species_diversity': 127,
+    'genetic_variants': 1543,
+    'conservation_status': 'Stable',
+    'population_trend': 'Increasing',
+    'threat_level': 'Low',
+    'last_updated': '2024-01-15',
+    'total_samples': 2847,
+    'analysis_completion': 94.2,
+    'rare_species_count': 23,
+    'endemic_species': 45,
+}
+
+_HEATMAP_DATA = [
+    [0.2, 0.4, 0.6, 0.8, 0.5, 0.3, 0.7],
+    [0.3, 0.6, 0.8, 0.4, 0.7, 0.5, 0.2],
+    [0.5, 0.3, 0.7, 0.9, 0.2, 0.6, 0.4],
+    [0.7, 0.5, 0.3, 0.6, 0.8, 0.4, 0.9],
+    [0.4, 0.8, 0.5, 0.2, 0.6, 0.7, 0.3],
+    [0.6, 0.2, 0.9, 0.5, 0.3, 0.8, 0.6],
+    [0.8, 0.7, 0.4, 0.3, 0.9, 0.2, 0.5],
+]
+
+_CHART_DATA = {
+    'temperature_trend': {
+        'labels': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+        'data': [22.1, 23.5, 24.2, 23.8, 22.9, 23.5]
+    },
+    'species_count': {
+        'labels': ['Mammals', 'Birds', 'Fish', 'Reptiles', 'Amphibians'],
+        'data': [45, 78, 123, 34, 56]
+    },
+    'genetic_diversity': {
+        'labels': ['Q1', 'Q2', 'Q3', 'Q4'],
+        'data': [0.75, 0.82, 0.78, 0.85]
+    },
+    'monthly_samples': {
+        'labels': ['Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+        'data': [234, 267, 298, 312, 289, 345]
+    }
+}
+
+# Pre-serialized, pre-encoded payloads for the API endpoints
+_ENVIRONMENTAL_JSON = json.dumps(_ENVIRONMENTAL_DATA).encode()
+_GENOMIC_JSON = json.dumps(_GENOMIC_DATA).encode()
+_CHART_JSON = json.dumps(_CHART_DATA).encode()
+
+
 # Data functions (hardcoded for demo purposes)
 def get_environmental_data():
     """Return hardcoded environmental monitoring data"""
-    return {
-        'temperature': {
-            'value': 23.5, 
-            'unit': '°C', 
-            'status': 'normal',
-            'description': 'Water temperature within optimal range'
-        },
-        'humidity': {
-            'value': 65, 
-            'unit': '%', 
-            'status': 'normal',
-            'description': 'Atmospheric humidity levels stable'
-        },
-        'ph_level': {
-            'value': 7.2, 
-            'unit': 'pH', 
-            'status': 'optimal',
-            'description': 'pH levels ideal for aquatic life'
-        },
-        'oxygen': {
-            'value': 8.5, 
-            'unit': 'mg/L', 
-            'status': 'good',
-            'description': 'Dissolved oxygen levels healthy'
-        },
-        'turbidity': {
-            'value': 2.1, 
-            'unit': 'NTU', 
-            'status': 'clear',
-            'description': 'Water clarity excellent'
-        },
-        'conductivity': {
-            'value': 450, 
-            'unit': 'μS/cm', 
-            'status': 'normal',
-            'description': 'Electrical conductivity within range'
-        },
-    }
+    return _ENVIRONMENTAL_DATA
 
 
 def get_genomic_data():
     """Return hardcoded genomic analysis data"""
-    return {
-        'species_diversity': 127,
-        'genetic_variants': 1543,
-        'conservation_status': 'Stable',
-        'population_trend': 'Increasing',
-        'threat_level': 'Low',
-        'last_updated': '2024-01-15',
-        'total_samples': 2847,
-        'analysis_completion': 94.2,
-        'rare_species_count': 23,
-        'endemic_species': 45,
-    }
+    return _GENOMIC_DATA
 
 
 def get_heatmap_data():
     """Return hardcoded heatmap data for biodiversity visualization"""
-    return [
-        [0.2, 0.4, 0.6, 0.8, 0.5, 0.3, 0.7],
-        [0.3, 0.6, 0.8, 0.4, 0.7, 0.5, 0.2],
-        [0.5, 0.3, 0.7, 0.9, 0.2, 0.6, 0.4],
-        [0.7, 0.5, 0.3, 0.6, 0.8, 0.4, 0.9],
-        [0.4, 0.8, 0.5, 0.2, 0.6, 0.7, 0.3],
-        [0.6, 0.2, 0.9, 0.5, 0.3, 0.8, 0.6],
-        [0.8, 0.7, 0.4, 0.3, 0.9, 0.2, 0.5],
-    ]
+    return _HEATMAP_DATA
 
 
 def get_chart_data():
     """Return hardcoded chart data for visualizations"""
-    return {
-        'temperature_trend': {
-            'labels': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
-            'data': [22.1, 23.5, 24.2, 23.8, 22.9, 23.5]
-        },
-        'species_count': {
-            'labels': ['Mammals', 'Birds', 'Fish', 'Reptiles', 'Amphibians'],
-            'data': [45, 78, 123, 34, 56]
-        },
-        'genetic_diversity': {
-            'labels': ['Q1', 'Q2', 'Q3', 'Q4'],
-            'data': [0.75, 0.82, 0.78, 0.85]
-        },
-        'monthly_samples': {
-            'labels': ['Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
-            'data': [234, 267, 298, 312, 289, 345]
-        }
-    }
+    return _CHART_DATA
 
 
 # API endpoints for AJAX requests (future use)
 @login_required
 def api_environmental_data(request):
     """API endpoint for environmental data"""
-    return JsonResponse(get_environmental_data())
+    return HttpResponse(_ENVIRONMENTAL_JSON, content_type='application/json')
 
 
 @login_required
 def api_genomic_data(request):
     """API endpoint for genomic data"""
-    return JsonResponse(get_genomic_data())
+    return HttpResponse(_GENOMIC_JSON, content_type='application/json')
 
 
 @login_required
 def api_chart_data(request):
     """API endpoint for chart data"""
-    return JsonResponse(get_chart_data())
\ No newline at end of file
+    return HttpResponse(_CHART_JSON, content_type='application/json')
\ No newline at end of file